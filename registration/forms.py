@@ -29,7 +29,7 @@ class RegistrationForm(forms.Form):
     registration backend.
     
     """
-    username = forms.RegexField(regex=r'^\w+$',
+    username = forms.RegexField(regex=r'^\w+\Z',
                                 max_length=30,
                                 widget=forms.TextInput(attrs=attrs_dict),
                                 label=_("Username"),
@@ -48,11 +48,9 @@ class RegistrationForm(forms.Form):
         in use.
         
         """
-        try:
-            user = User.objects.get(username__iexact=self.cleaned_data['username'])
-        except User.DoesNotExist:
-            return self.cleaned_data['username']
-        raise forms.ValidationError(_("A user with that username already exists."))
+        if User.objects.filter(username__iexact=self.cleaned_data['username']).values_list('pk', flat=True)[:1]:
+            raise forms.ValidationError(_("A user with that username already exists."))
+        return self.cleaned_data['username']
 
     def clean(self):
         """
@@ -91,7 +89,7 @@ class RegistrationFormUniqueEmail(RegistrationForm):
         site.
         
         """
-        if User.objects.filter(email__iexact=self.cleaned_data['email']):
+        if User.objects.filter(email__iexact=self.cleaned_data['email']).values_list('pk', flat=True)[:1]:
             raise forms.ValidationError(_("This email address is already in use. Please supply a different email address."))
         return self.cleaned_data['email']
 
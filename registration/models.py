@@ -47,7 +47,7 @@ class RegistrationManager(models.Manager):
         # the database.
         if SHA1_RE.search(activation_key):
             try:
-                profile = self.get(activation_key=activation_key)
+                profile = self.select_related('user').get(activation_key=activation_key)
             except self.model.DoesNotExist:
                 return False
             if not profile.activation_key_expired():
@@ -140,7 +140,7 @@ class RegistrationManager(models.Manager):
         be deleted.
         
         """
-        for profile in self.all():
+        for profile in self.select_related('user'):
             if profile.activation_key_expired():
                 user = profile.user
                 if not user.is_active:
@@ -166,7 +166,8 @@ class RegistrationProfile(models.Model):
     ACTIVATED = u"ALREADY_ACTIVATED"
     
     user = models.ForeignKey(User, unique=True, verbose_name=_('user'))
-    activation_key = models.CharField(_('activation key'), max_length=40)
+    activation_key = models.CharField(_('activation key'), max_length=40,
+                                      db_index=True)
     
     objects = RegistrationManager()
     
@@ -199,9 +200,10 @@ class RegistrationProfile(models.Model):
            method returns ``True``.
         
         """
+        if self.activation_key == self.ACTIVATED:
+            return True
         expiration_date = datetime.timedelta(days=settings.ACCOUNT_ACTIVATION_DAYS)
-        return self.activation_key == self.ACTIVATED or \
-               (self.user.date_joined + expiration_date <= datetime.datetime.now())
+        return self.user.date_joined + expiration_date <= datetime.datetime.now()
     activation_key_expired.boolean = True
 
     def send_activation_email(self, site):
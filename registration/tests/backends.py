@@ -221,8 +221,8 @@ class DefaultRegistrationBackendTests(TestCase):
                                              email='bob@example.com',
                                              password1='secret')
 
-        expired_user.date_joined = expired_user.date_joined - datetime.timedelta(days=settings.ACCOUNT_ACTIVATION_DAYS)
-        expired_user.save()
+        date_joined = expired_user.date_joined - datetime.timedelta(days=settings.ACCOUNT_ACTIVATION_DAYS)
+        User.objects.filter(pk=expired_user.pk).update(date_joined=date_joined)
         expired_profile = RegistrationProfile.objects.get(user=expired_user)
         self.failIf(self.backend.activate(_mock_request(),
                                           expired_profile.activation_key))
@@ -324,8 +324,8 @@ class DefaultRegistrationBackendTests(TestCase):
                                          username='bob',
                                          email='bob@example.com',
                                          password1='secret')
-        new_user.date_joined -= datetime.timedelta(days=settings.ACCOUNT_ACTIVATION_DAYS + 1)
-        new_user.save()
+        date_joined = new_user.date_joined - datetime.timedelta(days=settings.ACCOUNT_ACTIVATION_DAYS + 1)
+        User.objects.filter(pk=new_user.pk).update(date_joined=date_joined)
         profile = RegistrationProfile.objects.get(user=new_user)
         self.backend.activate(_mock_request(), profile.activation_key)
 
@@ -9,6 +9,35 @@ class RegistrationFormTests(TestCase):
     Test the default registration forms.
 
     """
+    # Data which ``RegistrationForm`` must reject, along with the
+    # field and errors it must report.
+    invalid_data_dicts = (
+        # Non-alphanumeric username.
+        {'data': {'username': 'foo/bar',
+                  'email': 'foo@example.com',
+                  'password1': 'foo',
+                  'password2': 'foo'},
+        'error': ('username', [u"This value must contain only letters, numbers and underscores."])},
+        # Username with a trailing newline.
+        {'data': {'username': 'foo\n',
+                  'email': 'foo@example.com',
+                  'password1': 'foo',
+                  'password2': 'foo'},
+        'error': ('username', [u"This value must contain only letters, numbers and underscores."])},
+        # Already-existing username.
+        {'data': {'username': 'alice',
+                  'email': 'alice@example.com',
+                  'password1': 'secret',
+                  'password2': 'secret'},
+        'error': ('username', [u"A user with that username already exists."])},
+        # Mismatched passwords.
+        {'data': {'username': 'foo',
+                  'email': 'foo@example.com',
+                  'password1': 'foo',
+                  'password2': 'bar'},
+        'error': ('__all__', [u"The two password fields didn't match."])},
+        )
+
     def test_registration_form(self):
         """
         Test that ``RegistrationForm`` enforces username constraints
@@ -16,31 +45,10 @@ class RegistrationFormTests(TestCase):
 
         """
         # Create a user so we can verify that duplicate usernames aren't
-        # permitted.
-        User.objects.create_user('alice', 'alice@example.com', 'secret')
-
-        invalid_data_dicts = [
-            # Non-alphanumeric username.
-            {'data': {'username': 'foo/bar',
-                      'email': 'foo@example.com',
-                      'password1': 'foo',
-                      'password2': 'foo'},
-            'error': ('username', [u"This value must contain only letters, numbers and underscores."])},
-            # Already-existing username.
-            {'data': {'username': 'alice',
-                      'email': 'alice@example.com',
-                      'password1': 'secret',
-                      'password2': 'secret'},
-            'error': ('username', [u"A user with that username already exists."])},
-            # Mismatched passwords.
-            {'data': {'username': 'foo',
-                      'email': 'foo@example.com',
-                      'password1': 'foo',
-                      'password2': 'bar'},
-            'error': ('__all__', [u"The two password fields didn't match."])},
-            ]
-
-        for invalid_dict in invalid_data_dicts:
+        # permitted; it only needs to exist, so it has no password.
+        User.objects.create_user('alice', 'alice@example.com')
+
+        for invalid_dict in self.invalid_data_dicts:
             form = forms.RegistrationForm(data=invalid_dict['data'])
             self.failIf(form.is_valid())
             self.assertEqual(form.errors[invalid_dict['error'][0]],
@@ -81,7 +89,7 @@ class RegistrationFormTests(TestCase):
         """
         # Create a user so we can verify that duplicate addresses
         # aren't permitted.
-        User.objects.create_user('alice', 'alice@example.com', 'secret')
+        User.objects.create_user('alice', 'alice@example.com')
 
         form = forms.RegistrationFormUniqueEmail(data={'username': 'foo',
                                                        'email': 'alice@example.com',